@@ -2,12 +2,16 @@
 
 import os
 from dataclasses import dataclass, fields
+from functools import lru_cache
 from typing import Optional, Any
 from typing_extensions import TypedDict
 from langchain_core.runnables import RunnableConfig
+from dotenv import load_dotenv
 
+load_dotenv()
 
-@dataclass(kw_only=True)
+
+@dataclass(kw_only=True, frozen=True)
 class Configuration:
     """LangGraph Configuration for the podcast creator agent."""
 
@@ -19,9 +23,8 @@ class Configuration:
     
     # Temperature settings for different use cases
     search_temperature: float = 0.0           # Factual search queries
-    synthesis_temperature: float = 0.3        # Balanced synthesis
-    script_temperature: float = 0.7           # Creative dialogue
-    metadata_temperature: float = 0.4         # Creative but focused
+    synthesis_temperature: float = 0.3        # Research report synthesis
+    script_temperature: float = 0.7           # Combined summary/metadata/script call
     
     # Podcast-specific settings
     host_name: str = "Alex"                   # Podcast host name
@@ -35,6 +38,11 @@ class Configuration:
     tts_channels: int = 1
     tts_rate: int = 24000
     tts_sample_width: int = 2
+    tts_segment_turns: int = 4                # Speaker turns per concurrent TTS request
+    tts_max_concurrency: int = 3              # Max TTS requests in flight at once
+    
+    # Caching
+    use_response_cache: bool = True           # False regenerates text instead of reusing cached replies
 
     @classmethod
     def from_runnable_config(
@@ -44,10 +52,29 @@ class Configuration:
         configurable = (
             config["configurable"] if config and "configurable" in config else {}
         )
-        values: dict[str, Any] = {
-            f.name: os.environ.get(f.name.upper(), configurable.get(f.name))
-            for f in fields(cls)
-            if f.init
-        }
-        return cls(**{k: v for k, v in values.items() if v})
+        # Only hashable field overrides take part in the cache key; LangGraph
+        # also stores its own runtime objects under "configurable". Falsy
+        # values such as search_temperature=0.0 are valid overrides.
+        overrides = frozenset(
+            (name, value)
+            for name, value in configurable.items()
+            if name in _FIELD_NAMES and value is not None
+        )
+        return _build_configuration(cls, overrides)
+
+
+_FIELD_NAMES = frozenset(f.name for f in fields(Configuration) if f.init)
+
+# Environment overrides are resolved once at import time
+_ENV_DEFAULTS: dict[str, Any] = {
+    name: os.environ[name.upper()]
+    for name in _FIELD_NAMES
+    if os.environ.get(name.upper())
+}
+
 
+@lru_cache(maxsize=32)
+def _build_configuration(cls: type, overrides: frozenset) -> Configuration:
+    """Build (and memoize) a Configuration from env defaults plus overrides."""
+    values: dict[str, Any] = {**_ENV_DEFAULTS, **dict(overrides)}
+    return cls(**values)
@@ -1,5 +1,10 @@
 """LangGraph implementation of the podcast creator workflow"""
 
+import asyncio
+import re
+from typing import Optional
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import StateGraph, START, END
 from langchain_core.runnables import RunnableConfig
 from google.genai import types
@@ -7,28 +12,19 @@ from google.genai import types
 from agent.state import PodcastState, PodcastStateInput, PodcastStateOutput
 from agent.utils import (
     display_gemini_response, 
-    create_professional_podcast, 
-    create_podcast_metadata,
-    synthesize_content,
-    genai_client
+    create_podcast_audio_async, 
+    estimate_duration,
+    generate_all_text_artifacts,
+    generate_content_async
 )
 from agent.configuration import Configuration
 from langsmith import traceable
 
-@traceable(run_type="llm", name="Research Agent", project_name="podcast-creator")
-def research_agent_node(state: PodcastState, config: RunnableConfig) -> dict:
-    """Research Agent - Web search and topic analysis"""
-    configuration = Configuration.from_runnable_config(config)
-    topic = state.get("topic")
-    
-    if not topic:
-        return {
-            "search_text": "No research topic provided.",
-            "search_sources_text": ""
-        }
-    
-    # Enhanced research prompt for podcast content
-    research_prompt = f"""
+# Characters not allowed in generated audio filenames (Unicode-aware)
+_UNSAFE_TITLE_CHARS = re.compile(r"[^\w \-]")
+
+
+_RESEARCH_PROMPT_TMPL = """
     Research this topic for creating an engaging podcast conversation: {topic}
     
     Focus on:
@@ -41,8 +37,18 @@ def research_agent_node(state: PodcastState, config: RunnableConfig) -> dict:
     
     Provide comprehensive information suitable for a 5-minute podcast discussion.
     """
+
+
+@traceable(run_type="llm", name="Research Agent", project_name="podcast-creator")
+async def research_agent_node(state: PodcastState, config: RunnableConfig) -> dict:
+    """Research Agent - Web search and topic analysis"""
+    configuration = Configuration.from_runnable_config(config)
+    topic = state.topic
+    
+    # Enhanced research prompt for podcast content
+    research_prompt = _RESEARCH_PROMPT_TMPL.format_map({"topic": topic})
     
-    search_response = genai_client.models.generate_content(
+    search_response = await generate_content_async(
         model=configuration.search_model,
         contents=research_prompt,
         config={
@@ -59,18 +65,7 @@ def research_agent_node(state: PodcastState, config: RunnableConfig) -> dict:
     }
 
 
-@traceable(run_type="llm", name="Video Analysis Agent", project_name="podcast-creator")
-def video_analysis_agent_node(state: PodcastState, config: RunnableConfig) -> dict:
-    """Video Analysis Agent - YouTube content extraction"""
-    configuration = Configuration.from_runnable_config(config)
-    video_url = state.get("video_url")
-    topic = state.get("topic", "this video content")
-    
-    if not video_url:
-        return {"video_text": "No video provided for analysis."}
-    
-    # Enhanced video analysis prompt for podcast content
-    video_prompt = f"""
+_VIDEO_PROMPT_TMPL = """
     Analyze this video for creating a podcast conversation about: {topic}
     
     Extract and focus on:
@@ -84,8 +79,19 @@ def video_analysis_agent_node(state: PodcastState, config: RunnableConfig) -> di
     
     Structure your analysis to be suitable for a 5-minute podcast conversation.
     """
+
+
+@traceable(run_type="llm", name="Video Analysis Agent", project_name="podcast-creator")
+async def video_analysis_agent_node(state: PodcastState, config: RunnableConfig) -> dict:
+    """Video Analysis Agent - YouTube content extraction"""
+    configuration = Configuration.from_runnable_config(config)
+    video_url = state.video_url
+    topic = state.topic or "this video content"
+    
+    # Enhanced video analysis prompt for podcast content
+    video_prompt = _VIDEO_PROMPT_TMPL.format_map({"topic": topic})
     
-    video_response = genai_client.models.generate_content(
+    video_response = await generate_content_async(
         model=configuration.video_model,
         contents=types.Content(
             parts=[
@@ -97,101 +103,85 @@ def video_analysis_agent_node(state: PodcastState, config: RunnableConfig) -> di
         )
     )
     
-    video_text, _ = display_gemini_response(video_response)
+    video_text, _ = display_gemini_response(video_response, collect_sources=False)
     
     return {"video_text": video_text}
 
 
-@traceable(run_type="llm", name="Content Synthesizer", project_name="podcast-creator")
-def content_synthesis_node(state: PodcastState, config: RunnableConfig) -> dict:
-    """Synthesize all content sources into key insights"""
-    configuration = Configuration.from_runnable_config(config)
-    
-    topic = state.get("topic", "the provided content")
-    search_text = state.get("search_text", "")
-    video_text = state.get("video_text", "")
+@traceable(run_type="chain", name="Parallel Ingest", project_name="podcast-creator")
+async def parallel_ingest_node(state: PodcastState, config: RunnableConfig) -> dict:
+    """Run research and video analysis concurrently and merge their results"""
+    # The task group cancels the other agent as soon as one of them fails
+    try:
+        async with asyncio.TaskGroup() as task_group:
+            tasks = []
+            if state.topic:
+                tasks.append(task_group.create_task(research_agent_node(state, config)))
+            if state.video_url:
+                tasks.append(task_group.create_task(video_analysis_agent_node(state, config)))
+    except ExceptionGroup as group:
+        # Surface the agent's own error (e.g. a Gemini APIError) rather than the group
+        raise group.exceptions[0] from None
     
-    content_summary, key_insights = synthesize_content(
-        topic, search_text, video_text, configuration
-    )
+    merged = {}
+    for task in tasks:
+        merged.update(task.result())
     
-    return {
-        "content_summary": content_summary,
-        "key_insights": key_insights
-    }
+    return merged
 
 
-@traceable(run_type="llm", name="Metadata Generator", project_name="podcast-creator") 
-def metadata_generator_node(state: PodcastState, config: RunnableConfig) -> dict:
-    """Generate podcast title, description, and topics"""
+@traceable(run_type="llm", name="Content Synthesizer & Script Writer", project_name="podcast-creator")
+def content_generation_node(state: PodcastState, config: RunnableConfig) -> dict:
+    """Synthesize content, metadata, and the podcast script in one call"""
     configuration = Configuration.from_runnable_config(config)
     
-    topic = state.get("topic", "")
-    content_summary = state.get("content_summary", "")
-    key_insights = state.get("key_insights", [])
+    topic = state.topic or "the provided content"
+    search_text = state.search_text or ""
+    video_text = state.video_text or ""
+    duration_minutes = state.duration_minutes or configuration.target_duration_minutes
     
-    podcast_title, podcast_description, topics_covered = create_podcast_metadata(
-        topic, content_summary, key_insights, configuration
+    artifacts = generate_all_text_artifacts(
+        topic, search_text, video_text, duration_minutes, configuration
     )
     
     return {
-        "podcast_title": podcast_title,
-        "podcast_description": podcast_description,
-        "topics_covered": topics_covered
+        "content_summary": artifacts.content_summary,
+        "key_insights": artifacts.key_insights,
+        "podcast_title": artifacts.title,
+        "podcast_description": artifacts.description,
+        "topics_covered": artifacts.topics_covered,
+        "podcast_script": artifacts.script,
+        # Derived from the script alone, so it is emitted before TTS starts
+        "duration_estimate": estimate_duration(artifacts.script)
     }
 
 
-@traceable(run_type="llm", name="Script Writer & Audio Producer", project_name="podcast-creator")
-def script_and_audio_node(state: PodcastState, config: RunnableConfig) -> dict:
-    """Script Writer + Audio Production - Generate conversation and TTS"""
+@traceable(run_type="llm", name="Audio Producer", project_name="podcast-creator")
+async def audio_production_node(state: PodcastState, config: RunnableConfig) -> dict:
+    """Audio Production - Generate multi-speaker TTS for the script"""
     configuration = Configuration.from_runnable_config(config)
     
-    topic = state.get("topic", "the content")
-    content_summary = state.get("content_summary", "")
-    key_insights = state.get("key_insights", [])
-    podcast_title = state.get("podcast_title", "Podcast Episode")
-    duration_minutes = state.get("duration_minutes", configuration.target_duration_minutes)
+    podcast_script = state.podcast_script or ""
+    podcast_title = state.podcast_title or "Podcast Episode"
     
     # Create unique filename based on title
-    safe_title = "".join(c for c in podcast_title if c.isalnum() or c in (' ', '-', '_')).rstrip()
-    filename = f"podcast_{safe_title.replace(' ', '_')}.wav"
+    safe_title = _UNSAFE_TITLE_CHARS.sub("", podcast_title).rstrip().replace(' ', '_')
+    filename = f"podcast_{safe_title}.wav"
     
-    podcast_script, podcast_filename, duration_estimate = create_professional_podcast(
-        topic, content_summary, key_insights, duration_minutes, filename, configuration
-    )
+    podcast_filename = await create_podcast_audio_async(podcast_script, filename, configuration)
     
-    return {
-        "podcast_script": podcast_script,
-        "podcast_audio_filename": podcast_filename,
-        "duration_estimate": duration_estimate
-    }
-
-
-def should_do_research(state: PodcastState) -> str:
-    """Conditional edge to determine if research should be performed"""
-    if state.get("topic"):
-        return "research_agent"
-    else:
-        return "video_analysis_agent"
-
-
-def should_do_video_analysis(state: PodcastState) -> str:
-    """Conditional edge after research to determine if video analysis needed"""
-    if state.get("video_url"):
-        return "video_analysis_agent"
-    else:
-        return "content_synthesis"
+    return {"podcast_audio_filename": podcast_filename}
 
 
 def validate_inputs(state: PodcastState) -> str:
     """Validate that at least one input is provided"""
-    topic = state.get("topic")
-    video_url = state.get("video_url")
+    topic = state.topic
+    video_url = state.video_url
     
     if not topic and not video_url:
         raise ValueError("At least one of 'topic' or 'video_url' must be provided")
     
-    return should_do_research(state)
+    return "parallel_ingest"
 
 
 def create_podcast_graph() -> StateGraph:
@@ -205,40 +195,34 @@ def create_podcast_graph() -> StateGraph:
     )
     
     # Add nodes
-    graph.add_node("research_agent", research_agent_node)
-    graph.add_node("video_analysis_agent", video_analysis_agent_node)
-    graph.add_node("content_synthesis", content_synthesis_node)
-    graph.add_node("metadata_generator", metadata_generator_node)
-    graph.add_node("script_and_audio", script_and_audio_node)
+    graph.add_node("parallel_ingest", parallel_ingest_node)
+    graph.add_node("content_generation", content_generation_node)
+    graph.add_node("audio_production", audio_production_node)
     
     # Add edges with validation
     graph.add_conditional_edges(
         START,
         validate_inputs,
-        {
-            "research_agent": "research_agent",
-            "video_analysis_agent": "video_analysis_agent"
-        }
+        {"parallel_ingest": "parallel_ingest"}
     )
     
-    graph.add_conditional_edges(
-        "research_agent",
-        should_do_video_analysis,
-        {
-            "video_analysis_agent": "video_analysis_agent",
-            "content_synthesis": "content_synthesis"
-        }
-    )
-    
-    graph.add_edge("video_analysis_agent", "content_synthesis")
-    graph.add_edge("content_synthesis", "metadata_generator")
-    graph.add_edge("metadata_generator", "script_and_audio")
-    graph.add_edge("script_and_audio", END)
+    graph.add_edge("parallel_ingest", "content_generation")
+    graph.add_edge("content_generation", "audio_production")
+    graph.add_edge("audio_production", END)
     
     return graph
 
 
-def create_compiled_graph():
-    """Create and compile the podcast creator graph"""
-    graph = create_podcast_graph()
-    return graph.compile()
\ No newline at end of file
+def create_compiled_graph(checkpointer: Optional[BaseCheckpointSaver] = None):
+    """Return the compiled podcast creator graph, optionally with a checkpointer"""
+    # LangGraph Platform supplies its own persistence, so the shared graph has none.
+    # A checkpointer (MemorySaver, SqliteSaver) makes standalone runs resumable:
+    # a failure after ingest resumes from the last checkpoint instead of re-running it.
+    if checkpointer is None:
+        return compiled_app
+    return create_podcast_graph().compile(checkpointer=checkpointer)
+
+
+# Compiled once and shared by all requests; use compiled_app.with_config(...)
+# for per-request configuration instead of recompiling
+compiled_app = create_podcast_graph().compile()
@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from typing_extensions import TypedDict
 from typing import Optional
 
@@ -20,29 +21,30 @@ class PodcastStateOutput(TypedDict):
     duration_estimate: str
     topics_covered: list[str]
 
-class PodcastState(TypedDict):
+@dataclass(slots=True)
+class PodcastState:
     """Complete state for the podcast creator workflow"""
     # Input fields
-    topic: Optional[str]
-    video_url: Optional[str]
-    duration_minutes: Optional[int]
+    topic: Optional[str] = None
+    video_url: Optional[str] = None
+    duration_minutes: Optional[int] = None
     
     # Intermediate results
-    search_text: Optional[str]
-    search_sources_text: Optional[str]
-    video_text: Optional[str]
+    search_text: Optional[str] = None
+    search_sources_text: Optional[str] = None
+    video_text: Optional[str] = None
     
     # Content synthesis
-    content_summary: Optional[str]
-    key_insights: Optional[list[str]]
+    content_summary: Optional[str] = None
+    key_insights: Optional[list[str]] = None
     
     # Final outputs
-    podcast_title: str
-    podcast_description: str
-    podcast_script: str
-    podcast_audio_filename: str
-    duration_estimate: str
-    topics_covered: list[str]
+    podcast_title: Optional[str] = None
+    podcast_description: Optional[str] = None
+    podcast_script: Optional[str] = None
+    podcast_audio_filename: Optional[str] = None
+    duration_estimate: Optional[str] = None
+    topics_covered: Optional[list[str]] = None
 
 # Backwards compatibility aliases
 ResearchStateInput = PodcastStateInput
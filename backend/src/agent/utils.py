@@ -1,82 +1,190 @@
 import os
-import wave
+import re
 import json
-from typing import List, Tuple
-from google.genai import Client, types
-from rich.console import Console
-from rich.markdown import Markdown
+import asyncio
+import struct
+import logging
+from collections import deque
+from functools import cache, lru_cache
+from hashlib import blake2b
+from typing import Any, List, Optional, Tuple
+import httpx
+from diskcache import Cache
+from google.genai import Client, errors, types
+from pydantic import BaseModel
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
 from dotenv import load_dotenv
 
 load_dotenv()
 
-# Initialize client
-genai_client = Client(api_key=os.getenv("GEMINI_API_KEY"))
+logger = logging.getLogger(__name__)
 
+# Shared connection pool for all Gemini calls (HTTP/2 multiplexes the parallel fan-out)
+_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
 
-def display_gemini_response(response):
-    """Extract text from Gemini response and display as markdown with references"""
-    console = Console()
-    
-    # Extract main content
+
+@cache
+def get_client() -> Client:
+    """Return the shared Gemini client, creating it on first use"""
+    # Explicit httpx transports also keep the SDK from switching the async
+    # client to aiohttp when that package happens to be installed
+    return Client(
+        api_key=os.getenv("GEMINI_API_KEY"),
+        http_options=types.HttpOptions(
+            client_args={"transport": httpx.HTTPTransport(http2=True, limits=_HTTP_LIMITS)},
+            async_client_args={"transport": httpx.AsyncHTTPTransport(http2=True, limits=_HTTP_LIMITS)},
+        ),
+    )
+
+
+class EmptyAudioError(Exception):
+    """Raised when a TTS request returns no audio data"""
+
+
+# Rate limiting, transient server errors, and deadline timeouts are worth retrying
+_RETRYABLE_STATUS_CODES = frozenset({429, 500, 503, 504})
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Return True for transient Gemini API failures"""
+    if isinstance(exc, EmptyAudioError):
+        return True
+    if isinstance(exc, errors.APIError):
+        return exc.code in _RETRYABLE_STATUS_CODES
+    # Timeouts, dropped connections, and HTTP/2 stream resets
+    return isinstance(exc, httpx.TransportError)
+
+
+gemini_retry = retry(
+    stop=stop_after_attempt(5),
+    wait=wait_exponential_jitter(initial=1, max=30),
+    retry=retry_if_exception(_is_retryable),
+    reraise=True,
+)
+
+
+@gemini_retry
+def generate_content(**kwargs):
+    """Call Gemini generate_content, retrying transient failures"""
+    return get_client().models.generate_content(**kwargs)
+
+
+@gemini_retry
+async def generate_content_async(**kwargs):
+    """Async Gemini generate_content, retrying transient failures"""
+    return await get_client().aio.models.generate_content(**kwargs)
+
+
+@cache
+def get_response_cache() -> Optional[Cache]:
+    """Return the persistent text response cache, or None if GEMINI_CACHE_DIR is set empty"""
+    cache_dir = os.getenv("GEMINI_CACHE_DIR", ".gemini_cache")
+    return Cache(cache_dir) if cache_dir else None
+
+
+def _to_jsonable(obj: Any) -> Any:
+    """Convert SDK config/content objects into JSON-serializable data"""
+    if isinstance(obj, type) and issubclass(obj, BaseModel):
+        return obj.model_json_schema()
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(exclude_none=True)
+    return repr(obj)
+
+
+def cached_generate(model: str, contents, config=None, parse=None, use_cache=True) -> Any:
+    """Generate text with Gemini, reusing cached responses for identical requests"""
+    response_cache = get_response_cache() if use_cache else None
+    if response_cache is not None:
+        fingerprint = json.dumps(
+            {"model": model, "contents": contents, "config": config},
+            sort_keys=True,
+            default=_to_jsonable,
+        )
+        key = blake2b(fingerprint.encode()).hexdigest()
+        text = response_cache.get(key)
+        if text is not None:
+            return parse(text) if parse is not None else text
+    
+    response = generate_content(
+        model=model,
+        contents=contents,
+        config=config,
+    )
     text = response.candidates[0].content.parts[0].text
-    md = Markdown(text)
-    console.print(md)
+    # Replies that fail parsing raise here and are never cached
+    result = parse(text) if parse is not None else text
+    # Empty (e.g. blocked) replies are returned as-is but not cached
+    if response_cache is not None and text is not None:
+        response_cache.set(key, text)
     
-    # Get candidate for grounding metadata
+    return result
+
+
+def display_gemini_response(response, collect_sources=True):
+    """Extract text and references from a Gemini response, logging them at debug level"""
+    # Extract main content
     candidate = response.candidates[0]
+    text = candidate.content.parts[0].text
+    logger.debug("Gemini response:\n%s", text)
     
     # Build sources text block
+    grounding_metadata = candidate.grounding_metadata
+    chunks = (grounding_metadata.grounding_chunks if grounding_metadata is not None else None) or []
     sources_text = ""
-    
-    # Display grounding metadata if available
-    if hasattr(candidate, 'grounding_metadata') and candidate.grounding_metadata:
-        console.print("\n" + "="*50)
-        console.print("[bold blue]References & Sources[/bold blue]")
-        console.print("="*50)
-        
-        # Display and collect source URLs
-        if candidate.grounding_metadata.grounding_chunks:
-            console.print(f"\n[bold]Sources ({len(candidate.grounding_metadata.grounding_chunks)}):[/bold]")
-            sources_list = []
-            for i, chunk in enumerate(candidate.grounding_metadata.grounding_chunks, 1):
-                if hasattr(chunk, 'web') and chunk.web:
-                    title = getattr(chunk.web, 'title', 'No title') or "No title"
-                    uri = getattr(chunk.web, 'uri', 'No URI') or "No URI"
-                    console.print(f"{i}. {title}")
-                    console.print(f"   [dim]{uri}[/dim]")
-                    sources_list.append(f"{i}. {title}\n   {uri}")
-            
-            sources_text = "\n".join(sources_list)
+    if collect_sources:
+        sources_list = [
+            f"{i}. {c.web.title or 'No title'}\n   {c.web.uri or 'No URI'}"
+            for i, c in enumerate(chunks, 1)
+            if c.web is not None
+        ]
+        sources_text = "\n".join(sources_list)
+    
+    # Log grounding metadata if available
+    if grounding_metadata is not None and logger.isEnabledFor(logging.DEBUG):
+        if sources_text:
+            logger.debug("Sources (%d):\n%s", len(chunks), sources_text)
         
-        # Display grounding supports (which text is backed by which sources)
-        if candidate.grounding_metadata.grounding_supports:
-            console.print(f"\n[bold]Text segments with source backing:[/bold]")
-            for support in candidate.grounding_metadata.grounding_supports[:5]:  # Show first 5
-                if hasattr(support, 'segment') and support.segment:
-                    snippet = support.segment.text[:100] + "..." if len(support.segment.text) > 100 else support.segment.text
-                    source_nums = [str(i+1) for i in support.grounding_chunk_indices]
-                    console.print(f"• \"{snippet}\" [dim](sources: {', '.join(source_nums)})[/dim]")
+        # Log grounding supports (which text is backed by which sources)
+        for support in (grounding_metadata.grounding_supports or [])[:5]:  # Show first 5
+            if support.segment is not None:
+                segment_text = support.segment.text or ""
+                snippet = segment_text[:100] + "..." if len(segment_text) > 100 else segment_text
+                source_nums = [str(i+1) for i in support.grounding_chunk_indices or []]
+                logger.debug("Source-backed segment: \"%s\" (sources: %s)", snippet, ", ".join(source_nums))
     
     return text, sources_text
 
 
+def _wave_header(data_size, channels, rate, sample_width):
+    """Build the 44-byte RIFF/WAVE header for PCM data of the given size"""
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 36 + data_size, b'WAVE',
+        b'fmt ', 16, 1, channels, rate, rate * channels * sample_width,
+        channels * sample_width, sample_width * 8,
+        b'data', data_size,
+    )
+
+
 def wave_file(filename, pcm, channels=1, rate=24000, sample_width=2):
     """Save PCM data to a wave file"""
-    with wave.open(filename, "wb") as wf:
-        wf.setnchannels(channels)
-        wf.setsampwidth(sample_width)
-        wf.setframerate(rate)
-        wf.writeframes(pcm)
+    wave_file_segments(filename, [pcm], channels, rate, sample_width)
 
 
-def synthesize_content(topic: str, search_text: str, video_text: str, configuration) -> Tuple[str, List[str]]:
-    """Synthesize all content sources into a comprehensive summary and key insights"""
-    
-    synthesis_prompt = f"""
-    You are a content synthesizer for podcast creation. Analyze all the provided content about "{topic}" and create:
-    
-    1. A comprehensive content summary (2-3 paragraphs)
-    2. A list of 5-7 key insights that would make for engaging podcast discussion
+def wave_file_segments(filename, pcm_segments, channels=1, rate=24000, sample_width=2):
+    """Save consecutive PCM segments to a single wave file without joining them first"""
+    data_size = sum(len(pcm) for pcm in pcm_segments)
+    fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, _wave_header(data_size, channels, rate, sample_width))
+        for pcm in pcm_segments:
+            os.write(fd, pcm)
+    finally:
+        os.close(fd)
+
+
+_TEXT_ARTIFACTS_PROMPT_TMPL = """
+    You are producing a {duration_minutes}-minute podcast episode about "{topic}". Analyze all the provided content and create every artifact below in one pass.
     
     RESEARCH CONTENT:
     {search_text}
@@ -84,166 +192,318 @@ def synthesize_content(topic: str, search_text: str, video_text: str, configurat
     VIDEO CONTENT:
     {video_text}
     
-    Focus on:
-    - Most interesting and discussion-worthy points
-    - Practical insights and takeaways
-    - Surprising or counterintuitive information
-    - Different perspectives or debates
-    - Real-world applications
-    
-    Format your response as JSON:
-    {{
-        "content_summary": "comprehensive summary...",
-        "key_insights": ["insight 1", "insight 2", "insight 3", ...]
-    }}
-    """
+    1. content_summary: A comprehensive content summary (2-3 paragraphs)
+    2. key_insights: A list of 5-7 key insights that would make for engaging podcast discussion
+       Focus on:
+       - Most interesting and discussion-worthy points
+       - Practical insights and takeaways
+       - Surprising or counterintuitive information
+       - Different perspectives or debates
+       - Real-world applications
+    3. title: Catchy, professional podcast title (60 characters max)
+    4. description: Engaging description (150-200 words) that would make people want to listen
+    5. topics_covered: List of 3-5 main topics covered
+    6. script: A natural, engaging podcast conversation between {host_name} (curious host) and {expert_name} (knowledgeable expert) that covers the content summary and key insights
+    
+    SCRIPT CONVERSATION STYLE: {conversation_style}
+    
+    Script structure (aim for ~{target_words} words total):
+    1. {host_name} introduces the topic and {expert_name} (30 seconds)
+    2. Main discussion covering key insights (3-4 minutes)
+    3. Practical takeaways and wrap-up (30-60 seconds)
     
-    response = genai_client.models.generate_content(
-        model=configuration.synthesis_model,
-        contents=synthesis_prompt,
-        config={"temperature": configuration.synthesis_temperature}
-    )
+    Script guidelines:
+    - Make it conversational and natural
+    - {host_name} asks thoughtful questions
+    - {expert_name} provides clear, insightful answers
+    - Include smooth transitions between topics
+    - End with a memorable takeaway
     
-    try:
-        result = json.loads(response.candidates[0].content.parts[0].text)
-        return result["content_summary"], result["key_insights"]
-    except:
-        # Fallback if JSON parsing fails
-        text = response.candidates[0].content.parts[0].text
-        return text, ["Key insight from content analysis"]
+    Format the script exactly like this:
+    {host_name}: [opening introduction]
+    {expert_name}: [expert response]
+    {host_name}: [follow-up question]
+    {expert_name}: [detailed explanation]
+    [continue natural conversation...]
+    """
 
 
-def create_podcast_metadata(topic: str, content_summary: str, key_insights: List[str], configuration) -> Tuple[str, str, List[str]]:
-    """Generate podcast title, description, and topic list"""
-    
-    metadata_prompt = f"""
-    Create engaging podcast metadata for a {configuration.target_duration_minutes}-minute episode about "{topic}".
-    
-    CONTENT SUMMARY:
-    {content_summary}
-    
-    KEY INSIGHTS:
-    {', '.join(key_insights)}
-    
-    Generate:
-    1. Catchy, professional podcast title (60 characters max)
-    2. Engaging description (150-200 words) that would make people want to listen
-    3. List of 3-5 main topics covered
-    
-    Format as JSON:
-    {{
-        "title": "Engaging Podcast Title",
-        "description": "Professional description that hooks the listener...",
-        "topics_covered": ["topic 1", "topic 2", "topic 3"]
-    }}
-    """
-    
-    response = genai_client.models.generate_content(
+class PodcastTextArtifacts(BaseModel):
+    """Structured output of the combined synthesis/metadata/script call"""
+    content_summary: str
+    key_insights: List[str]
+    title: str
+    description: str
+    topics_covered: List[str]
+    script: str
+
+
+def generate_all_text_artifacts(topic: str, search_text: str, video_text: str,
+                                duration_minutes: int, configuration) -> PodcastTextArtifacts:
+    """Synthesize content, metadata, and the podcast script in a single structured call"""
+    
+    text_prompt = _TEXT_ARTIFACTS_PROMPT_TMPL.format_map({
+        "topic": topic,
+        "search_text": search_text,
+        "video_text": video_text,
+        "duration_minutes": duration_minutes,
+        "target_words": duration_minutes * 200,
+        "host_name": configuration.host_name,
+        "expert_name": configuration.expert_name,
+        "conversation_style": configuration.conversation_style,
+    })
+    
+    # Same validation the SDK applies for response.parsed, but it also works on cached text
+    return cached_generate(
         model=configuration.synthesis_model,
-        contents=metadata_prompt,
-        config={"temperature": configuration.metadata_temperature}
+        contents=text_prompt,
+        config=types.GenerateContentConfig(
+            temperature=configuration.script_temperature,
+            response_mime_type="application/json",
+            response_schema=PodcastTextArtifacts,
+        ),
+        parse=PodcastTextArtifacts.model_validate_json,
+        use_cache=configuration.use_response_cache,
     )
-    
-    try:
-        result = json.loads(response.candidates[0].content.parts[0].text)
-        return result["title"], result["description"], result["topics_covered"]
-    except:
-        # Fallback
-        return f"Podcast: {topic}", f"An insightful discussion about {topic}", [topic]
 
 
-def create_professional_podcast(topic: str, content_summary: str, key_insights: List[str], 
-                               duration_minutes: int, filename: str, configuration) -> Tuple[str, str, str]:
-    """Create a professional podcast conversation and generate TTS audio"""
-    
-    # Step 1: Generate professional script
-    script_prompt = f"""
-    Create a natural, engaging {duration_minutes}-minute podcast conversation between {configuration.host_name} (curious host) and {configuration.expert_name} (knowledgeable expert) about "{topic}".
+_SCRIPT_PROMPT_TMPL = """
+    Create a natural, engaging {duration_minutes}-minute podcast conversation between {host_name} (curious host) and {expert_name} (knowledgeable expert) about "{topic}".
     
     CONTENT TO COVER:
     {content_summary}
     
     KEY INSIGHTS TO DISCUSS:
-    {', '.join(key_insights)}
+    {key_insights}
     
-    CONVERSATION STYLE: {configuration.conversation_style}
+    CONVERSATION STYLE: {conversation_style}
     
-    Structure (aim for ~{duration_minutes * 200} words total):
-    1. {configuration.host_name} introduces the topic and {configuration.expert_name} (30 seconds)
+    Structure (aim for ~{target_words} words total):
+    1. {host_name} introduces the topic and {expert_name} (30 seconds)
     2. Main discussion covering key insights (3-4 minutes)
     3. Practical takeaways and wrap-up (30-60 seconds)
     
     Guidelines:
     - Make it conversational and natural
-    - {configuration.host_name} asks thoughtful questions
-    - {configuration.expert_name} provides clear, insightful answers
+    - {host_name} asks thoughtful questions
+    - {expert_name} provides clear, insightful answers
     - Include smooth transitions between topics
     - End with a memorable takeaway
     
     Format exactly like this:
-    {configuration.host_name}: [opening introduction]
-    {configuration.expert_name}: [expert response]
-    {configuration.host_name}: [follow-up question]
-    {configuration.expert_name}: [detailed explanation]
+    {host_name}: [opening introduction]
+    {expert_name}: [expert response]
+    {host_name}: [follow-up question]
+    {expert_name}: [detailed explanation]
     [continue natural conversation...]
     """
+
+
+def create_professional_podcast(topic: str, content_summary: str, key_insights: List[str], 
+                               duration_minutes: int, filename: str, configuration) -> Tuple[str, str, str]:
+    """Create a professional podcast conversation and generate TTS audio"""
     
-    script_response = genai_client.models.generate_content(
+    # Step 1: Generate professional script
+    script_prompt = _SCRIPT_PROMPT_TMPL.format_map({
+        "topic": topic,
+        "content_summary": content_summary,
+        "key_insights": ', '.join(key_insights),
+        "duration_minutes": duration_minutes,
+        "target_words": duration_minutes * 200,
+        "host_name": configuration.host_name,
+        "expert_name": configuration.expert_name,
+        "conversation_style": configuration.conversation_style,
+    })
+    
+    podcast_script = cached_generate(
         model=configuration.synthesis_model,
         contents=script_prompt,
-        config={"temperature": configuration.script_temperature}
+        config={"temperature": configuration.script_temperature},
+        use_cache=configuration.use_response_cache,
     )
     
-    podcast_script = script_response.candidates[0].content.parts[0].text
-    
     # Step 2: Generate TTS audio
-    tts_prompt = f"""Create a professional podcast conversation between {configuration.host_name} and {configuration.expert_name}:
+    full_path = create_podcast_audio(podcast_script, filename, configuration)
+    
+    return podcast_script, full_path, estimate_duration(podcast_script)
+
+
+def estimate_duration(podcast_script: str) -> str:
+    """Estimate spoken duration of a script (rough calculation at ~200 words/min)"""
+    # Space count approximates the word count without materializing a token list
+    word_count = podcast_script.count(' ') + 1
+    minutes, remaining_words = divmod(word_count, 200)
+    return f"{minutes} min {remaining_words // 3} sec"
+
+
+_TTS_PROMPT_TMPL = """Create a professional podcast conversation between {host_name} and {expert_name}:
 
 {podcast_script}"""
-    
-    response = genai_client.models.generate_content(
-        model=configuration.tts_model,
-        contents=tts_prompt,
-        config=types.GenerateContentConfig(
-            response_modalities=["AUDIO"],
-            speech_config=types.SpeechConfig(
-                multi_speaker_voice_config=types.MultiSpeakerVoiceConfig(
-                    speaker_voice_configs=[
-                        types.SpeakerVoiceConfig(
-                            speaker=configuration.host_name,
-                            voice_config=types.VoiceConfig(
-                                prebuilt_voice_config=types.PrebuiltVoiceConfig(
-                                    voice_name=configuration.host_voice,
-                                )
+
+
+def _tts_generation_config(configuration) -> types.GenerateContentConfig:
+    """Build the multi-speaker TTS config for the host and expert voices"""
+    return types.GenerateContentConfig(
+        response_modalities=["AUDIO"],
+        speech_config=types.SpeechConfig(
+            multi_speaker_voice_config=types.MultiSpeakerVoiceConfig(
+                speaker_voice_configs=[
+                    types.SpeakerVoiceConfig(
+                        speaker=configuration.host_name,
+                        voice_config=types.VoiceConfig(
+                            prebuilt_voice_config=types.PrebuiltVoiceConfig(
+                                voice_name=configuration.host_voice,
                             )
-                        ),
-                        types.SpeakerVoiceConfig(
-                            speaker=configuration.expert_name,
-                            voice_config=types.VoiceConfig(
-                                prebuilt_voice_config=types.PrebuiltVoiceConfig(
-                                    voice_name=configuration.expert_voice,
-                                )
+                        )
+                    ),
+                    types.SpeakerVoiceConfig(
+                        speaker=configuration.expert_name,
+                        voice_config=types.VoiceConfig(
+                            prebuilt_voice_config=types.PrebuiltVoiceConfig(
+                                voice_name=configuration.expert_voice,
                             )
-                        ),
-                    ]
-                )
+                        )
+                    ),
+                ]
             )
         )
     )
+
+
+@gemini_retry
+def create_podcast_audio(podcast_script: str, filename: str, configuration) -> str:
+    """Generate multi-speaker TTS audio for a podcast script and save it as a wave file"""
+    
+    # Not cached - the payload is raw audio bytes
+    tts_prompt = _TTS_PROMPT_TMPL.format_map({
+        "podcast_script": podcast_script,
+        "host_name": configuration.host_name,
+        "expert_name": configuration.expert_name,
+    })
     
-    # Step 3: Save audio file
-    audio_data = response.candidates[0].content.parts[0].inline_data.data
     audio_dir = "generated_podcasts"
     os.makedirs(audio_dir, exist_ok=True)
     full_path = os.path.join(audio_dir, filename)
-    wave_file(full_path, audio_data, configuration.tts_channels, configuration.tts_rate, configuration.tts_sample_width)
     
-    # Estimate duration (rough calculation)
-    word_count = len(podcast_script.split())
-    estimated_duration = f"{word_count // 200} min {(word_count % 200) // 3} sec"
+    response_stream = get_client().models.generate_content_stream(
+        model=configuration.tts_model,
+        contents=tts_prompt,
+        config=_tts_generation_config(configuration)
+    )
+    
+    # Write PCM chunks to disk as they arrive instead of buffering the whole clip
+    channels, rate, sample_width = configuration.tts_channels, configuration.tts_rate, configuration.tts_sample_width
+    fd = os.open(full_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        # Reserve the header, stream the PCM, then fill in the final sizes
+        os.write(fd, _wave_header(0, channels, rate, sample_width))
+        data_size = 0
+        for chunk in response_stream:
+            if not chunk.candidates or not chunk.candidates[0].content or not chunk.candidates[0].content.parts:
+                continue
+            inline_data = chunk.candidates[0].content.parts[0].inline_data
+            if inline_data and inline_data.data:
+                data_size += os.write(fd, inline_data.data)
+        os.pwrite(fd, _wave_header(data_size, channels, rate, sample_width), 0)
+    finally:
+        os.close(fd)
+    
+    logger.info("Professional podcast saved as: %s", full_path)
+    return full_path
+
+
+@lru_cache(maxsize=16)
+def _turn_start_pattern(host_name: str, expert_name: str) -> re.Pattern:
+    """Compile (once per speaker pair) the pattern matching the start of a speaker turn"""
+    return re.compile(
+        rf"^[ \t*]*(?:{re.escape(host_name)}|{re.escape(expert_name)})[ \t*]*:",
+        re.MULTILINE,
+    )
+
+
+def split_script_segments(podcast_script: str, configuration) -> List[str]:
+    """Split a script into segments of whole speaker turns for concurrent TTS"""
+    turn_start = _turn_start_pattern(configuration.host_name, configuration.expert_name)
+    starts = [match.start() for match in turn_start.finditer(podcast_script)]
+    if not starts:
+        return [podcast_script]
+    
+    # Any preamble before the first turn stays with the first segment
+    starts[0] = 0
+    turns = [podcast_script[a:b].strip() for a, b in zip(starts, starts[1:] + [len(podcast_script)])]
+    step = configuration.tts_segment_turns
+    return ["\n".join(turns[i:i + step]) for i in range(0, len(turns), step)]
+
+
+@gemini_retry
+async def _synthesize_segment(segment: str, configuration) -> bytes:
+    """Generate PCM audio for one script segment"""
+    tts_prompt = _TTS_PROMPT_TMPL.format_map({
+        "podcast_script": segment,
+        "host_name": configuration.host_name,
+        "expert_name": configuration.expert_name,
+    })
+    
+    response = await get_client().aio.models.generate_content(
+        model=configuration.tts_model,
+        contents=tts_prompt,
+        config=_tts_generation_config(configuration)
+    )
+    
+    if not response.candidates or not response.candidates[0].content or not response.candidates[0].content.parts:
+        raise EmptyAudioError("TTS response has no content for the script segment")
+    pcm = b"".join(
+        part.inline_data.data
+        for part in response.candidates[0].content.parts
+        if part.inline_data and part.inline_data.data
+    )
+    # Retried like a server error; a silent gap would otherwise be stitched into the episode
+    if not pcm:
+        raise EmptyAudioError("TTS response has no audio for the script segment")
+    return pcm
+
+
+async def create_podcast_audio_async(podcast_script: str, filename: str, configuration) -> str:
+    """Generate TTS audio for script segments concurrently and save it as one wave file"""
+    segments = split_script_segments(podcast_script, configuration)
     
-    print(f"Professional podcast saved as: {full_path}")
-    return podcast_script, full_path, estimated_duration
+    # Bound concurrent requests; the TTS models have low rate limits
+    semaphore = asyncio.Semaphore(configuration.tts_max_concurrency)
+    
+    async def synthesize_bounded(segment: str) -> bytes:
+        async with semaphore:
+            return await _synthesize_segment(segment, configuration)
+    
+    audio_dir = "generated_podcasts"
+    os.makedirs(audio_dir, exist_ok=True)
+    full_path = os.path.join(audio_dir, filename)
+    
+    channels, rate, sample_width = configuration.tts_channels, configuration.tts_rate, configuration.tts_sample_width
+    fd = os.open(full_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        # Reserve the header, append each segment as soon as it and all earlier
+        # ones are done, then fill in the final sizes. Only segments finished
+        # ahead of a slower earlier one are held in memory.
+        os.write(fd, _wave_header(0, channels, rate, sample_width))
+        data_size = 0
+        try:
+            # Total TTS latency approaches the slowest batch instead of the whole script;
+            # the task group cancels the remaining segments if one fails
+            async with asyncio.TaskGroup() as task_group:
+                pending = deque(
+                    task_group.create_task(synthesize_bounded(segment))
+                    for segment in segments
+                )
+                while pending:
+                    data_size += os.write(fd, await pending.popleft())
+        except ExceptionGroup as group:
+            raise group.exceptions[0] from None
+        os.pwrite(fd, _wave_header(data_size, channels, rate, sample_width), 0)
+    finally:
+        os.close(fd)
+    
+    logger.info("Professional podcast saved as: %s", full_path)
+    return full_path
 
 
 # Keep the existing create_podcast_discussion function for backwards compatibility
@@ -259,16 +519,7 @@ def create_podcast_discussion(topic, search_text, video_text, search_sources_tex
     )
 
 
-def create_research_report(topic, search_text, video_text, search_sources_text, video_url, configuration=None):
-    """Create a comprehensive research report by synthesizing search and video content"""
-    
-    # Use default values if no configuration provided
-    if configuration is None:
-        from agent.configuration import Configuration
-        configuration = Configuration()
-    
-    # Step 1: Create synthesis using Gemini
-    synthesis_prompt = f"""
+_REPORT_PROMPT_TMPL = """
     You are a research analyst. I have gathered information about "{topic}" from two sources:
     
     SEARCH RESULTS:
@@ -285,17 +536,32 @@ def create_research_report(topic, search_text, video_text, search_sources_text,
     
     Focus on creating a coherent narrative that brings together the best insights from both sources.
     """
+
+
+def create_research_report(topic, search_text, video_text, search_sources_text, video_url, configuration=None):
+    """Create a comprehensive research report by synthesizing search and video content"""
     
-    synthesis_response = genai_client.models.generate_content(
+    # Use default values if no configuration provided
+    if configuration is None:
+        from agent.configuration import Configuration
+        configuration = Configuration()
+    
+    # Step 1: Create synthesis using Gemini
+    synthesis_prompt = _REPORT_PROMPT_TMPL.format_map({
+        "topic": topic,
+        "search_text": search_text,
+        "video_text": video_text,
+    })
+    
+    synthesis_text = cached_generate(
         model=configuration.synthesis_model,
         contents=synthesis_prompt,
         config={
             "temperature": configuration.synthesis_temperature,
-        }
+        },
+        use_cache=configuration.use_response_cache,
     )
     
-    synthesis_text = synthesis_response.candidates[0].content.parts[0].text
-    
     # Step 2: Create markdown report
     report = f"""# Research Report: {topic}
 
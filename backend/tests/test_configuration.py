@@ -0,0 +1,47 @@
+import pytest
+
+from agent import configuration
+from agent.configuration import Configuration
+
+
+@pytest.fixture(autouse=True)
+def env_defaults(monkeypatch):
+    monkeypatch.setattr(configuration, "_ENV_DEFAULTS", {"search_model": "env-model", "search_temperature": 0.5})
+    configuration._build_configuration.cache_clear()
+    yield configuration._ENV_DEFAULTS
+    configuration._build_configuration.cache_clear()
+
+
+def test_env_defaults_apply_without_overrides():
+    config = Configuration.from_runnable_config()
+
+    assert config.search_model == "env-model"
+    assert config.synthesis_model == Configuration.synthesis_model
+
+
+def test_configurable_overrides_env():
+    config = Configuration.from_runnable_config({"configurable": {"search_model": "run-model"}})
+
+    assert config.search_model == "run-model"
+
+
+def test_falsy_override_is_kept():
+    config = Configuration.from_runnable_config({"configurable": {"search_temperature": 0.0}})
+
+    assert config.search_temperature == 0.0
+
+
+def test_none_and_unknown_keys_are_ignored():
+    config = Configuration.from_runnable_config(
+        {"configurable": {"search_model": None, "thread_id": "abc", "__pregel_runtime": object()}}
+    )
+
+    assert config.search_model == "env-model"
+
+
+def test_identical_overrides_reuse_the_cached_instance():
+    first = Configuration.from_runnable_config({"configurable": {"host_name": "Riley"}})
+    second = Configuration.from_runnable_config({"configurable": {"host_name": "Riley", "thread_id": "t2"}})
+
+    assert first is second
+    assert configuration._build_configuration.cache_info().hits == 1
@@ -0,0 +1,273 @@
+import asyncio
+import struct
+import wave
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from google.genai import errors
+from tenacity import wait_none
+
+from agent import utils
+from agent.utils import (
+    PodcastTextArtifacts,
+    cached_generate,
+    split_script_segments,
+    wave_file_segments,
+)
+
+
+def make_configuration(turns_per_segment=2):
+    return SimpleNamespace(
+        host_name="Alex",
+        expert_name="Sam",
+        tts_segment_turns=turns_per_segment,
+        tts_model="tts",
+        tts_max_concurrency=3,
+        tts_channels=1,
+        tts_rate=24000,
+        tts_sample_width=2,
+    )
+
+
+def make_response(text):
+    part = SimpleNamespace(text=text)
+    return SimpleNamespace(candidates=[SimpleNamespace(content=SimpleNamespace(parts=[part]))])
+
+
+@pytest.fixture
+def response_cache(monkeypatch, tmp_path):
+    monkeypatch.setenv("GEMINI_CACHE_DIR", str(tmp_path / "cache"))
+    utils.get_response_cache.cache_clear()
+    yield utils.get_response_cache()
+    utils.get_response_cache().close()
+    utils.get_response_cache.cache_clear()
+
+
+@pytest.fixture
+def replies(monkeypatch):
+    queued = []
+    calls = []
+
+    def fake_generate_content(**kwargs):
+        calls.append(kwargs)
+        return make_response(queued.pop(0))
+
+    monkeypatch.setattr(utils, "generate_content", fake_generate_content)
+    return SimpleNamespace(queued=queued, calls=calls)
+
+
+def test_cached_generate_reuses_cached_reply(response_cache, replies):
+    replies.queued.extend(["first", "second"])
+
+    assert cached_generate("model", "prompt") == "first"
+    assert cached_generate("model", "prompt") == "first"
+    assert len(replies.calls) == 1
+
+
+def test_cached_generate_skips_cache_when_disabled(response_cache, replies):
+    replies.queued.extend(["first", "second"])
+
+    assert cached_generate("model", "prompt") == "first"
+    assert cached_generate("model", "prompt", use_cache=False) == "second"
+
+
+def test_cached_generate_does_not_cache_empty_reply(response_cache, replies):
+    replies.queued.extend([None, "text"])
+
+    assert cached_generate("model", "prompt") is None
+    assert len(response_cache) == 0
+    assert cached_generate("model", "prompt") == "text"
+
+
+def test_cached_generate_returns_parsed_reply(response_cache, replies):
+    artifacts = PodcastTextArtifacts(
+        content_summary="Summary",
+        key_insights=["Insight"],
+        title="Title",
+        description="Description",
+        topics_covered=["Topic"],
+        script="Alex: Hi",
+    )
+    replies.queued.append(artifacts.model_dump_json())
+
+    parse = PodcastTextArtifacts.model_validate_json
+    assert cached_generate("model", "prompt", parse=parse) == artifacts
+    assert cached_generate("model", "prompt", parse=parse) == artifacts
+    assert len(replies.calls) == 1
+
+
+def test_cached_generate_does_not_cache_malformed_reply(response_cache, replies):
+    replies.queued.append('{"title": "Truncated')
+
+    with pytest.raises(ValueError):
+        cached_generate("model", "prompt", parse=PodcastTextArtifacts.model_validate_json)
+
+    assert len(response_cache) == 0
+
+
+@pytest.mark.parametrize(
+    ("exc", "expected"),
+    [
+        (errors.ClientError(429, {}), True),
+        (errors.ServerError(500, {}), True),
+        (errors.ServerError(503, {}), True),
+        (errors.ServerError(504, {}), True),
+        (errors.ClientError(400, {}), False),
+        (errors.ClientError(403, {}), False),
+        (httpx.ReadTimeout("timed out"), True),
+        (httpx.ConnectError("refused"), True),
+        (httpx.RemoteProtocolError("stream reset"), True),
+        (utils.EmptyAudioError("no audio"), True),
+        (ValueError("bad reply"), False),
+    ],
+)
+def test_is_retryable(exc, expected):
+    assert utils._is_retryable(exc) is expected
+
+
+def make_audio_response(*chunks):
+    parts = [SimpleNamespace(inline_data=SimpleNamespace(data=chunk)) for chunk in chunks]
+    return SimpleNamespace(candidates=[SimpleNamespace(content=SimpleNamespace(parts=parts))])
+
+
+@pytest.fixture
+def tts_responses(monkeypatch):
+    queued = []
+    calls = []
+
+    async def fake_generate_content(**kwargs):
+        calls.append(kwargs)
+        return queued.pop(0)
+
+    client = SimpleNamespace(aio=SimpleNamespace(models=SimpleNamespace(generate_content=fake_generate_content)))
+    monkeypatch.setattr(utils, "get_client", lambda: client)
+    monkeypatch.setattr(utils, "_tts_generation_config", lambda configuration: None)
+    return SimpleNamespace(queued=queued, calls=calls)
+
+
+def synthesize_segment(segment):
+    synthesize = utils._synthesize_segment.retry_with(wait=wait_none())
+    return asyncio.run(synthesize(segment, make_configuration()))
+
+
+def test_synthesize_segment_joins_audio_parts(tts_responses):
+    tts_responses.queued.append(make_audio_response(b"\x01\x00", None, b"\x02\x00"))
+
+    assert synthesize_segment("Alex: Hi") == b"\x01\x00\x02\x00"
+    assert "Alex: Hi" in tts_responses.calls[0]["contents"]
+
+
+def test_synthesize_segment_retries_empty_responses(tts_responses):
+    empty_candidate = SimpleNamespace(candidates=[SimpleNamespace(content=None)])
+    tts_responses.queued.extend([
+        SimpleNamespace(candidates=None),
+        empty_candidate,
+        make_audio_response(b""),
+        make_audio_response(b"\x01\x00"),
+    ])
+
+    assert synthesize_segment("Alex: Hi") == b"\x01\x00"
+    assert len(tts_responses.calls) == 4
+
+
+def test_synthesize_segment_gives_up_without_audio(tts_responses):
+    tts_responses.queued.extend([make_audio_response() for _ in range(5)])
+
+    with pytest.raises(utils.EmptyAudioError):
+        synthesize_segment("Alex: Hi")
+    assert len(tts_responses.calls) == 5
+
+
+def test_split_script_segments_groups_whole_turns():
+    script = "Alex: Hi\nSam: Hello\nAlex: Question\nSam: Answer\nAlex: Bye"
+
+    segments = split_script_segments(script, make_configuration())
+
+    assert segments == [
+        "Alex: Hi\nSam: Hello",
+        "Alex: Question\nSam: Answer",
+        "Alex: Bye",
+    ]
+
+
+def test_split_script_segments_keeps_preamble_with_first_turn():
+    script = "Intro music\n\nAlex: Welcome\nSam: Thanks"
+
+    segments = split_script_segments(script, make_configuration())
+
+    assert segments == ["Intro music\n\nAlex: Welcome\nSam: Thanks"]
+
+
+def test_split_script_segments_handles_bold_names_and_continuation_lines():
+    script = "**Alex:** First line\nstill Alex\nSam's aside\n**Sam:** Reply"
+
+    segments = split_script_segments(script, make_configuration(turns_per_segment=1))
+
+    assert segments == ["**Alex:** First line\nstill Alex\nSam's aside", "**Sam:** Reply"]
+
+
+def test_split_script_segments_without_speaker_turns():
+    script = "Just narration"
+
+    assert split_script_segments(script, make_configuration()) == [script]
+
+
+def test_wave_file_segments_writes_header_sizes(tmp_path):
+    path = tmp_path / "out.wav"
+    segments = [b"\x01\x00" * 10, b"\x02\x00" * 5]
+
+    wave_file_segments(str(path), segments, channels=1, rate=24000, sample_width=2)
+
+    data = path.read_bytes()
+    riff_size = struct.unpack_from("<I", data, 4)[0]
+    data_size = struct.unpack_from("<I", data, 40)[0]
+    assert data_size == 30
+    assert riff_size == 36 + data_size
+    assert data[44:] == b"".join(segments)
+
+    with wave.open(str(path), "rb") as wf:
+        assert wf.getnchannels() == 1
+        assert wf.getsampwidth() == 2
+        assert wf.getframerate() == 24000
+        assert wf.getnframes() == 15
+
+
+def test_create_podcast_audio_async_writes_segments_in_script_order(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    delays = {"Alex: One": 0.03, "Sam: Two": 0.0, "Alex: Three": 0.01}
+
+    async def fake_synthesize_segment(segment, configuration):
+        await asyncio.sleep(delays[segment])
+        return segment.encode().ljust(12, b"\x00")
+
+    monkeypatch.setattr(utils, "_synthesize_segment", fake_synthesize_segment)
+    script = "Alex: One\nSam: Two\nAlex: Three"
+
+    path = asyncio.run(utils.create_podcast_audio_async(script, "out.wav", make_configuration(turns_per_segment=1)))
+
+    data = (tmp_path / path).read_bytes()
+    assert struct.unpack_from("<I", data, 40)[0] == 36
+    assert data[44:] == b"".join(segment.encode().ljust(12, b"\x00") for segment in delays)
+
+
+def test_create_podcast_audio_async_cancels_remaining_segments_on_failure(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    cancelled = []
+
+    async def fake_synthesize_segment(segment, configuration):
+        if segment == "Sam: Two":
+            raise errors.ClientError(400, {})
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(segment)
+            raise
+        return b"\x00\x00"
+
+    monkeypatch.setattr(utils, "_synthesize_segment", fake_synthesize_segment)
+    script = "Alex: One\nSam: Two\nAlex: Three"
+
+    with pytest.raises(errors.ClientError):
+        asyncio.run(utils.create_podcast_audio_async(script, "out.wav", make_configuration(turns_per_segment=1)))
+    assert sorted(cancelled) == ["Alex: One", "Alex: Three"]